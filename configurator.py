@@ -8,14 +8,16 @@ configurator.py
 # Import from standard library. https://docs.python.org/3/library/
 
 import argparse
+import functools
+import hashlib
 import json
 import linecache
 import logging
 import os
-import shutil
 import signal
 import string
 import sys
+import threading
 import time
 from enum import IntFlag
 from urllib.parse import urlparse, urlunparse
@@ -26,38 +28,92 @@ from flask import Flask, Response, json
 from flask import request as flask_request
 from flask_api import status
 
+# Use orjson on JSON hot paths when it is available.
+
+try:
+    import orjson
+
+    def json_dumps_sorted(an_object):
+        ''' Serialize to JSON bytes with sorted keys. '''
+        return orjson.dumps(an_object, option=orjson.OPT_SORT_KEYS)
+
+    def json_dumps_bytes(an_object):
+        ''' Serialize to JSON bytes. '''
+        return orjson.dumps(an_object)
+
+    json_loads = orjson.loads
+
+except ImportError:
+
+    def json_dumps_sorted(an_object):
+        ''' Serialize to JSON bytes with sorted keys. '''
+        return json.dumps(an_object, sort_keys=True).encode()
+
+    def json_dumps_bytes(an_object):
+        ''' Serialize to JSON bytes. '''
+        return json.dumps(an_object, separators=(',', ':')).encode()
+
+    json_loads = json.loads
+
 # Import Senzing libraries.
+# The Senzing SDK is a heavy import that the "sleep", "version", and
+# "docker-acceptance-test" subcommands never need, so it is loaded on
+# first use rather than at module import.
 
 # Determine "Major" version of Senzing SDK.
 
 SENZING_SDK_VERSION_MAJOR = None
+SENZING_SDK_IMPORT_ATTEMPTED = False
 
-# Import from Senzing.
-
-try:
-    from senzing import G2Config, G2ConfigMgr, G2Engine, G2EngineFlags, G2Exception, G2ModuleException
-    SENZING_SDK_VERSION_MAJOR = 3
 
-except Exception:
+def import_senzing_sdk():
+    ''' Import the Senzing SDK on first use.  Idempotent.
+        Return the "Major" version of the Senzing SDK.
+    '''
+    global G2Config, G2ConfigMgr, G2Engine, G2EngineFlags, G2Exception, G2ModuleException
+    global SENZING_SDK_VERSION_MAJOR, SENZING_SDK_IMPORT_ATTEMPTED
 
-    # Fall back to pre-Senzing-Python-SDK style of imports.
+    if SENZING_SDK_IMPORT_ATTEMPTED:
+        return SENZING_SDK_VERSION_MAJOR
+    SENZING_SDK_IMPORT_ATTEMPTED = True
 
     try:
-        from G2Config import G2Config
-        from G2ConfigMgr import G2ConfigMgr
-        from G2Engine import G2Engine
-        from G2Exception import G2Exception, G2ModuleException
+        from senzing import G2Config, G2ConfigMgr, G2Engine, G2EngineFlags, G2Exception, G2ModuleException
+        SENZING_SDK_VERSION_MAJOR = 3
+
+    except ImportError:
+
+        # Fall back to pre-Senzing-Python-SDK style of imports.
+
+        try:
+            from G2Config import G2Config
+            from G2ConfigMgr import G2ConfigMgr
+            from G2Engine import G2Engine
+            from G2Exception import G2Exception, G2ModuleException
+
+            # Create a class like what is seen in Senzing Version 3.
 
-        # Create a class like what is seen in Senzing Version 3.
+            class G2EngineFlags(IntFlag):
+                ''' Create an object similar to what is seen in Senzing V2. '''
+                G2_EXPORT_DEFAULT_FLAGS = G2Engine.G2_EXPORT_DEFAULT_FLAGS
 
-        class G2EngineFlags(IntFlag):
-            ''' Create an object similar to what is seen in Senzing V2. '''
-            G2_EXPORT_DEFAULT_FLAGS = G2Engine.G2_EXPORT_DEFAULT_FLAGS
+            SENZING_SDK_VERSION_MAJOR = 2
 
-        SENZING_SDK_VERSION_MAJOR = 2
+            # Backport Senzing Version 3 method names onto the V2 classes
+            # so instances need no per-object rebinding.
 
-    except Exception:
-        SENZING_SDK_VERSION_MAJOR = None
+            G2Config.addDataSource = G2Config.addDataSourceV2
+            G2Config.init = G2Config.initV2
+            G2Config.listDataSources = G2Config.listDataSourcesV2
+            G2ConfigMgr.init = G2ConfigMgr.initV2
+            G2Engine.init = G2Engine.initV2
+            G2Engine.initWithConfigID = G2Engine.initWithConfigIDV2
+            G2Engine.reinit = G2Engine.reinitV2
+
+        except ImportError:
+            SENZING_SDK_VERSION_MAJOR = None
+
+    return SENZING_SDK_VERSION_MAJOR
 
 # Flask application.
 
@@ -73,6 +129,23 @@ __updated__ = '2023-04-03'
 SENZING_PRODUCT_ID = "5009"  # See https://github.com/senzing-garage/knowledge-base/blob/main/lists/senzing-product-ids.md
 LOG_FORMAT = '%(asctime)s %(message)s'
 
+# Map SENZING_LOG_LEVEL values to logging levels.
+# See https://docs.python.org/3/library/logging.html#levels
+
+LOG_LEVEL_MAP = {
+    "notset": logging.NOTSET,
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "fatal": logging.FATAL,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL
+}
+
+# Root logger, bound once so hot paths can test isEnabledFor() cheaply.
+
+LOGGER = logging.getLogger()
+
 # Working with bytes.
 
 KILOBYTES = 1024
@@ -85,6 +158,9 @@ SAFE_CHARACTER_LIST = ['$', '-', '_', '.', '+', '!', '*', '(', ')', ',', '"'] +
 UNSAFE_CHARACTER_LIST = ['"', '<', '>', '#', '%', '{', '}', '|', '\\', '^', '~', '[', ']', '`']
 RESERVED_CHARACTER_LIST = [';', ',', '/', '?', ':', '@', '=', '&']
 
+SAFE_CHARACTER_SET = frozenset(SAFE_CHARACTER_LIST)
+UNSAFE_CHARACTER_SET = frozenset(UNSAFE_CHARACTER_LIST)
+
 # The "configuration_locator" describes where configuration variables are in:
 # 1) Command line options, 2) Environment variables, 3) Configuration files, 4) Default values
 
@@ -148,23 +224,59 @@ CONFIGURATION_LOCATOR = {
 
 # Enumerate keys in 'configuration_locator' that should not be printed to the log.
 
-KEYS_TO_REDACT = [
+KEYS_TO_REDACT = frozenset([
+    "_g2_configuration_json_cached",
     "engine_configuration_json",
     "g2_database_url_generic",
     "g2_database_url_specific"
-]
+])
+
+# String values that are interpreted as boolean True.
+
+TRUTHY_VALUES = frozenset(['true', '1', 't', 'y', 'yes'])
+
+
+def string_to_boolean(value):
+    ''' Convert a boolean-like string into a boolean. '''
+    if isinstance(value, str):
+        return value.lower() in TRUTHY_VALUES
+    return value
+
+
+# Map configuration keys to the type coercion applied in get_configuration().
+
+CONFIGURATION_COERCIONS = {
+    "debug": string_to_boolean,
+    "sleep_time_in_seconds": int,
+    "config_path": os.path.abspath,
+    "resource_path": os.path.abspath,
+    "support_path": os.path.abspath,
+}
+
+# (configuration key, environment variable) pairs, indexed once at import time.
+
+CONFIGURATION_ENV_VARS = [(key, value['env']) for key, value in CONFIGURATION_LOCATOR.items() if value.get('env')]
 
 # Global cached objects
 
+G2_CLIENT_SINGLETON = None
 G2_CONFIGURATION_MANAGER_SINGLETON = None
 G2_ENGINE_SINGLETON = None
 G2_CONFIG_SINGLETON = None
 
+# Locks guarding lazy creation of the singletons when Flask runs threaded.
+
+G2_CLIENT_LOCK = threading.Lock()
+G2_CONFIGURATION_MANAGER_LOCK = threading.Lock()
+G2_ENGINE_LOCK = threading.Lock()
+G2_CONFIG_LOCK = threading.Lock()
+
 # -----------------------------------------------------------------------------
 # Define argument parser
 # -----------------------------------------------------------------------------
 
 
+@functools.cache
 def get_parser():
     ''' Parse commandline arguments. '''
 
@@ -251,61 +363,75 @@ MESSAGE_ERROR = 700
 MESSAGE_DEBUG = 900
 
 MESSAGE_DICTIONARY = {
-    "100": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}I",
-    "101": "Adding datasource '{0}'. Response: {1}",
-    "104": "CONFIG_DATA_ID: {0} plus datasources: {1}",
-    "105": "CONFIG_DATA_ID: {0} passed validity tests.",
-    "292": "Configuration change detected.  Old: {0} New: {1}",
-    "293": "For information on warnings and errors, see https://github.com/senzing-garage/configurator#errors",
-    "294": "Version: {0}  Updated: {1}",
-    "295": "Sleeping infinitely.",
-    "296": "Sleeping {0} seconds.",
-    "297": "Enter {0}",
-    "298": "Exit {0}",
-    "299": "{0}",
-    "300": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}W",
-    "301": "SYS_CFG.CONFIG_DATA_ID: {0} did not pass initialization validation.",
-    "302": "SYS_CFG.CONFIG_DATA_ID: {0} did not pass search validation.",
-    "499": "{0}",
-    "500": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
-    "695": "Unknown database scheme '{0}' in database url '{1}'",
-    "696": "Bad SENZING_SUBCOMMAND: {0}.",
-    "697": "No processing done.",
-    "698": "Program terminated with error.",
-    "699": "{0}",
-    "700": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
-    "701": "Error '{0}' caused by {1} error '{2}'",
-    "886": "G2Engine.addRecord() bad return code: {0}; JSON: {1}",
-    "888": "G2Engine.addRecord() G2ModuleNotInitialized: {0}; JSON: {1}",
-    "889": "G2Engine.addRecord() G2ModuleGenericException: {0}; JSON: {1}",
-    "890": "G2Engine.addRecord() Exception: {0}; JSON: {1}",
-    "891": "Original and new database URLs do not match. Original URL: {0}; Reconstructed URL: {1}",
-    "892": "Could not initialize G2Product with '{0}'. Error: {1}",
-    "893": "Could not initialize G2Hasher with '{0}'. Error: {1}",
-    "894": "Could not initialize G2Diagnostic with '{0}'. Error: {1}",
-    "895": "Could not initialize G2Audit with '{0}'. Error: {1}",
-    "896": "Could not initialize G2ConfigMgr with '{0}'. Error: {1}",
-    "897": "Could not initialize G2Config with '{0}'. Error: {1}",
-    "898": "Could not initialize G2Engine with '{0}'. Error: {1}",
-    "899": "{0}",
-    "900": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}D",
-    "901": "Signal: {0}; Frame: {1}",
-    "902": "Subcommand: {0}; Args: {1}",
-    "998": "Debugging enabled.",
-    "999": "{0}",
+    100: "senzing-" + SENZING_PRODUCT_ID + "{0:04d}I",
+    101: "Adding datasource '{0}'. Response: {1}",
+    104: "CONFIG_DATA_ID: {0} plus datasources: {1}",
+    105: "CONFIG_DATA_ID: {0} passed validity tests.",
+    292: "Configuration change detected.  Old: {0} New: {1}",
+    293: "For information on warnings and errors, see https://github.com/senzing-garage/configurator#errors",
+    294: "Version: {0}  Updated: {1}",
+    295: "Sleeping infinitely.",
+    296: "Sleeping {0} seconds.",
+    297: "Enter {0}",
+    298: "Exit {0}",
+    299: "{0}",
+    300: "senzing-" + SENZING_PRODUCT_ID + "{0:04d}W",
+    301: "SYS_CFG.CONFIG_DATA_ID: {0} did not pass initialization validation.",
+    302: "SYS_CFG.CONFIG_DATA_ID: {0} did not pass search validation.",
+    499: "{0}",
+    500: "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
+    695: "Unknown database scheme '{0}' in database url '{1}'",
+    696: "Bad SENZING_SUBCOMMAND: {0}.",
+    697: "No processing done.",
+    698: "Program terminated with error.",
+    699: "{0}",
+    700: "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
+    701: "Error '{0}' caused by {1} error '{2}'",
+    886: "G2Engine.addRecord() bad return code: {0}; JSON: {1}",
+    888: "G2Engine.addRecord() G2ModuleNotInitialized: {0}; JSON: {1}",
+    889: "G2Engine.addRecord() G2ModuleGenericException: {0}; JSON: {1}",
+    890: "G2Engine.addRecord() Exception: {0}; JSON: {1}",
+    891: "Original and new database URLs do not match. Original URL: {0}; Reconstructed URL: {1}",
+    892: "Could not initialize G2Product with '{0}'. Error: {1}",
+    893: "Could not initialize G2Hasher with '{0}'. Error: {1}",
+    894: "Could not initialize G2Diagnostic with '{0}'. Error: {1}",
+    895: "Could not initialize G2Audit with '{0}'. Error: {1}",
+    896: "Could not initialize G2ConfigMgr with '{0}'. Error: {1}",
+    897: "Could not initialize G2Config with '{0}'. Error: {1}",
+    898: "Could not initialize G2Engine with '{0}'. Error: {1}",
+    899: "{0}",
+    900: "senzing-" + SENZING_PRODUCT_ID + "{0:04d}D",
+    901: "Signal: {0}; Frame: {1}",
+    902: "Subcommand: {0}; Args: {1}",
+    998: "Debugging enabled.",
+    999: "{0}",
 }
 
 
+# Cache of "<level-prefix> <template>" strings, keyed by (generic_index, index).
+
+MESSAGE_TEMPLATE_CACHE = {}
+
+
 def message(index, *args):
     ''' Return an instantiated message. '''
-    index_string = str(index)
-    template = MESSAGE_DICTIONARY.get(index_string, "No message for index {0}.".format(index_string))
+    template = MESSAGE_DICTIONARY.get(index, "No message for index {0}.".format(index))
+    if not args:
+        return template
     return template.format(*args)
 
 
 def message_generic(generic_index, index, *args):
     ''' Return a formatted message. '''
-    return "{0} {1}".format(message(generic_index, index), message(index, *args))
+    cache_key = (generic_index, index)
+    template = MESSAGE_TEMPLATE_CACHE.get(cache_key)
+    if template is None:
+        index_template = MESSAGE_DICTIONARY.get(index, "No message for index {0}.".format(index))
+        template = "{0} {1}".format(message(generic_index, index), index_template)
+        MESSAGE_TEMPLATE_CACHE[cache_key] = template
+    if not args:
+        return template
+    return template.format(*args)
 
 
 def message_info(index, *args):
@@ -331,6 +457,15 @@ def message_debug(index, *args):
 def get_exception():
     ''' Get details about an exception. '''
     exception_type, exception_object, traceback = sys.exc_info()
+    if traceback is None:
+        return {
+            "filename": None,
+            "line_number": None,
+            "line": "",
+            "exception": exception_object,
+            "type": exception_type,
+            "traceback": None,
+        }
     frame = traceback.tb_frame
     line_number = traceback.tb_lineno
     filename = frame.f_code.co_filename
@@ -350,37 +485,31 @@ def get_exception():
 # -----------------------------------------------------------------------------
 
 
-def translate(mapping, astring):
-    ''' Translate characters. '''
+def translate(table, astring):
+    ''' Translate characters using a table built by str.maketrans(). '''
 
-    new_string = str(astring)
-    for key, value in mapping.items():
-        new_string = new_string.replace(key, value)
-    return new_string
+    return str(astring).translate(table)
 
 
 def get_unsafe_characters(astring):
     ''' Return the list of unsafe characters found in astring. '''
 
-    result = []
-    for unsafe_character in UNSAFE_CHARACTER_LIST:
-        if unsafe_character in astring:
-            result.append(unsafe_character)
-    return result
+    characters_in_string = UNSAFE_CHARACTER_SET.intersection(astring)
+    return [character for character in UNSAFE_CHARACTER_LIST if character in characters_in_string]
 
 
 def get_safe_characters(astring):
-    ''' Return the list of safe characters found in astring. '''
+    ''' Return the list of safe characters not found in astring. '''
 
-    result = []
-    for safe_character in SAFE_CHARACTER_LIST:
-        if safe_character not in astring:
-            result.append(safe_character)
-    return result
+    characters_in_string = SAFE_CHARACTER_SET.intersection(astring)
+    return [character for character in SAFE_CHARACTER_LIST if character not in characters_in_string]
 
 
+@functools.lru_cache(maxsize=32)
 def parse_database_url(original_senzing_database_url):
-    ''' Given a canonical database URL, decompose into URL components. '''
+    ''' Given a canonical database URL, decompose into URL components.
+        Results are cached; callers must not mutate the returned dictionary.
+    '''
 
     result = {}
 
@@ -388,6 +517,24 @@ def parse_database_url(original_senzing_database_url):
 
     senzing_database_url = original_senzing_database_url
 
+    # Fast path: a URL with no unsafe characters needs no translation.
+
+    if UNSAFE_CHARACTER_SET.isdisjoint(senzing_database_url):
+        parsed = urlparse(senzing_database_url)
+        return {
+            'scheme': parsed.scheme,
+            'netloc': parsed.netloc,
+            'path': parsed.path,
+            'params': parsed.params,
+            'query': parsed.query,
+            'fragment': parsed.fragment,
+            'username': parsed.username,
+            'password': parsed.password,
+            'hostname': parsed.hostname,
+            'port': parsed.port,
+            'schema': parsed.path.strip('/'),
+        }
+
     # Create lists of safe and unsafe characters.
 
     unsafe_characters = get_unsafe_characters(senzing_database_url)
@@ -403,13 +550,13 @@ def parse_database_url(original_senzing_database_url):
     # This makes a map of safe character mapping to unsafe characters.
     # "senzing_database_url" is modified to have only safe characters.
 
-    translation_map = {}
-    safe_characters_index = 0
-    for unsafe_character in unsafe_characters:
-        safe_character = safe_characters[safe_characters_index]
-        safe_characters_index += 1
-        translation_map[safe_character] = unsafe_character
-        senzing_database_url = senzing_database_url.replace(unsafe_character, safe_character)
+    translation_map = dict(zip(safe_characters, unsafe_characters))
+    senzing_database_url = senzing_database_url.translate(
+        str.maketrans(dict(zip(unsafe_characters, safe_characters))))
+
+    # Build a translation table for restoring the unsafe characters.
+
+    translation_table = str.maketrans(translation_map)
 
     # Parse "translated" URL.
 
@@ -419,32 +566,36 @@ def parse_database_url(original_senzing_database_url):
     # Construct result.
 
     result = {
-        'scheme': translate(translation_map, parsed.scheme),
-        'netloc': translate(translation_map, parsed.netloc),
-        'path': translate(translation_map, parsed.path),
-        'params': translate(translation_map, parsed.params),
-        'query': translate(translation_map, parsed.query),
-        'fragment': translate(translation_map, parsed.fragment),
-        'username': translate(translation_map, parsed.username),
-        'password': translate(translation_map, parsed.password),
-        'hostname': translate(translation_map, parsed.hostname),
-        'port': translate(translation_map, parsed.port),
-        'schema': translate(translation_map, schema),
+        'scheme': translate(translation_table, parsed.scheme),
+        'netloc': translate(translation_table, parsed.netloc),
+        'path': translate(translation_table, parsed.path),
+        'params': translate(translation_table, parsed.params),
+        'query': translate(translation_table, parsed.query),
+        'fragment': translate(translation_table, parsed.fragment),
+        'username': translate(translation_table, parsed.username),
+        'password': translate(translation_table, parsed.password),
+        'hostname': translate(translation_table, parsed.hostname),
+        'port': translate(translation_table, parsed.port),
+        'schema': translate(translation_table, schema),
     }
 
     # For safety, compare original URL with reconstructed URL.
-
-    url_parts = [
-        result.get('scheme'),
-        result.get('netloc'),
-        result.get('path'),
-        result.get('params'),
-        result.get('query'),
-        result.get('fragment'),
-    ]
-    test_senzing_database_url = urlunparse(url_parts)
-    if test_senzing_database_url != original_senzing_database_url:
-        logging.warning(message_warning(891, original_senzing_database_url, test_senzing_database_url))
+    # The check only produces a warning, so skip it when warnings are
+    # suppressed.  Because parse_database_url() is cached, it runs at most
+    # once per unique URL anyway.
+
+    if LOGGER.isEnabledFor(logging.WARNING):
+        url_parts = [
+            result.get('scheme'),
+            result.get('netloc'),
+            result.get('path'),
+            result.get('params'),
+            result.get('query'),
+            result.get('fragment'),
+        ]
+        test_senzing_database_url = urlunparse(url_parts)
+        if test_senzing_database_url != original_senzing_database_url:
+            logging.warning(message_warning(891, original_senzing_database_url, test_senzing_database_url))
 
     # Return result.
 
@@ -455,6 +606,18 @@ def parse_database_url(original_senzing_database_url):
 # -----------------------------------------------------------------------------
 
 
+# Map each supported database scheme to its URL format.
+
+SCHEME_FORMATS = {
+    "mysql": "{scheme}://{username}:{password}@{hostname}:{port}/?schema={schema}",
+    "postgresql": "{scheme}://{username}:{password}@{hostname}:{port}:{schema}/",
+    "db2": "{scheme}://{username}:{password}@{schema}",
+    "sqlite3": "{scheme}://{netloc}{path}",
+    "mssql": "{scheme}://{username}:{password}@{schema}",
+}
+
+
+@functools.lru_cache(maxsize=32)
 def get_g2_database_url_specific(generic_database_url):
     ''' Given a canonical database URL, transform to the specific URL. '''
 
@@ -464,16 +627,9 @@ def get_g2_database_url_specific(generic_database_url):
 
     # Format database URL for a particular database.
 
-    if scheme in ['mysql']:
-        result = "{scheme}://{username}:{password}@{hostname}:{port}/?schema={schema}".format(**parsed_database_url)
-    elif scheme in ['postgresql']:
-        result = "{scheme}://{username}:{password}@{hostname}:{port}:{schema}/".format(**parsed_database_url)
-    elif scheme in ['db2']:
-        result = "{scheme}://{username}:{password}@{schema}".format(**parsed_database_url)
-    elif scheme in ['sqlite3']:
-        result = "{scheme}://{netloc}{path}".format(**parsed_database_url)
-    elif scheme in ['mssql']:
-        result = "{scheme}://{username}:{password}@{schema}".format(**parsed_database_url)
+    scheme_format = SCHEME_FORMATS.get(scheme)
+    if scheme_format:
+        result = scheme_format.format(**parsed_database_url)
     else:
         logging.error(message_error(695, scheme, generic_database_url))
 
@@ -482,86 +638,56 @@ def get_g2_database_url_specific(generic_database_url):
 
 def get_configuration(subcommand, args):
     ''' Order of precedence: CLI, OS environment variables, INI file, default. '''
-    result = {}
-
     # Copy default values into configuration dictionary.
 
-    for key, value in list(CONFIGURATION_LOCATOR.items()):
-        result[key] = value.get('default', None)
-
-    # "Prime the pump" with command line args. This will be done again as the last step.
-
-    for key, value in list(args.__dict__.items()):
-        new_key = key.format(subcommand.replace('-', '_'))
-        if value:
-            result[new_key] = value
+    result = {key: value.get('default') for key, value in CONFIGURATION_LOCATOR.items()}
 
     # Copy OS environment variables into configuration dictionary.
 
-    for key, value in list(CONFIGURATION_LOCATOR.items()):
-        os_env_var = value.get('env', None)
-        if os_env_var:
-            os_env_value = os.getenv(os_env_var, None)
-            if os_env_value:
-                result[key] = os_env_value
+    environ = os.environ
+    for key, os_env_var in CONFIGURATION_ENV_VARS:
+        os_env_value = environ.get(os_env_var)
+        if os_env_value:
+            result[key] = os_env_value
 
     # Copy 'args' into configuration dictionary.
 
-    for key, value in list(args.__dict__.items()):
-        new_key = key.format(subcommand.replace('-', '_'))
+    for key, value in args.__dict__.items():
         if value:
-            result[new_key] = value
+            result[key] = value
 
     # Add program information.
 
     result['program_version'] = __version__
     result['program_updated'] = __updated__
-    result['senzing_sdk_version_major'] = SENZING_SDK_VERSION_MAJOR
+
+    # The SDK import is lazy, so trigger it here for the one subcommand
+    # that uses it; otherwise the logged version would always be null.
+
+    if result.get('subcommand') == 'service':
+        result['senzing_sdk_version_major'] = import_senzing_sdk()
+    else:
+        result['senzing_sdk_version_major'] = None
 
     # Special case: subcommand from command-line
 
     if args.subcommand:
         result['subcommand'] = args.subcommand
 
-    # Special case: Change boolean strings to booleans.
-
-    booleans = [
-        'debug'
-    ]
-    for boolean in booleans:
-        boolean_value = result.get(boolean)
-        if isinstance(boolean_value, str):
-            boolean_value_lower_case = boolean_value.lower()
-            if boolean_value_lower_case in ['true', '1', 't', 'y', 'yes']:
-                result[boolean] = True
-            else:
-                result[boolean] = False
-
-    # Special case: Change integer strings to integers.
-
-    integers = [
-        'sleep_time_in_seconds'
-    ]
-    for integer in integers:
-        integer_string = result.get(integer)
-        result[integer] = int(integer_string)
-
-    # Special case: Determine absolute paths.
+    # Special case: Coerce values to expected types (booleans, integers, absolute paths).
 
-    paths = [
-        'config_path',
-        'resource_path',
-        'support_path',
-    ]
-    for path in paths:
-        relative_path = result.get(path)
-        if relative_path:
-            result[path] = os.path.abspath(relative_path)
+    for key, coercion in CONFIGURATION_COERCIONS.items():
+        value = result.get(key)
+        if value:
+            result[key] = coercion(value)
 
     # Special case:  Tailored database URL
     # If requested, prepare internal database.
+    # This must happen even when the engine configuration is given
+    # directly, since its CONNECTION may point at the internal database.
 
     if result.get('g2_internal_database'):
+        import shutil
         g2_internal_database_path = result.get('g2_internal_database')
         g2_internal_database_directory = os.path.dirname(g2_internal_database_path)
 
@@ -572,6 +698,13 @@ def get_configuration(subcommand, args):
 
         shutil.copyfile("/var/opt/senzing/g2/data/G2C.db", g2_internal_database_path)
         result['g2_database_url_specific'] = "sqlite3://na:na@{0}".format(g2_internal_database_path)
+    elif result.get('engine_configuration_json'):
+
+        # When the engine configuration is given directly,
+        # get_g2_configuration_json() never looks at the database URL,
+        # so skip its computation.
+
+        result['g2_database_url_specific'] = None
     else:
         result['g2_database_url_specific'] = get_g2_database_url_specific(result.get("g2_database_url_generic"))
     return result
@@ -615,13 +748,7 @@ def validate_configuration(config):
 
 def redact_configuration(config):
     ''' Return a shallow copy of config with certain keys removed. '''
-    result = config.copy()
-    for key in KEYS_TO_REDACT:
-        try:
-            result.pop(key)
-        except Exception:
-            pass
-    return result
+    return {key: value for key, value in config.items() if key not in KEYS_TO_REDACT}
 
 # -----------------------------------------------------------------------------
 # Class: G2Client
@@ -639,7 +766,13 @@ class G2Client:
         self.g2_config = g2_config
         self.g2_configuration_manager = g2_configuration_manager
         self.g2_engine = g2_engine
-        self.senzing_sdk_version_major = config.get("senzing_sdk_version_major")
+        self.senzing_sdk_version_major = import_senzing_sdk()
+
+        # Caches invalidated by persist_configuration().
+
+        self.config_handle_cache = None
+        self.default_config_id_cache = None
+        self.datasources_cache = None
 
         # Must run after instance variable are set.
 
@@ -652,14 +785,15 @@ class G2Client:
         response_bytearray = bytearray()
 
         # Add data sources to configuration.
+        # The single response buffer is cleared and reused; the Senzing SDK
+        # appends into the bytearray it is given.
 
         for datasource in datasources:
-            data_source_dictionary = {
-                "DSRC_CODE": datasource
-            }
-            data_source_json = json.dumps(data_source_dictionary)
+            response_bytearray.clear()
+            data_source_json = '{"DSRC_CODE": ' + json.dumps(datasource) + '}'
             self.g2_config.addDataSource(config_handle, data_source_json, response_bytearray)
-            logging.info(message_info(101, datasource, response_bytearray.decode()))
+            if LOGGER.isEnabledFor(logging.INFO):
+                LOGGER.info(message_info(101, datasource, response_bytearray.decode()))
 
         config_id = self.get_default_config_id()
         configuration_comment = message(104, config_id, datasources)
@@ -671,6 +805,11 @@ class G2Client:
     def get_config_handle(self):
         ''' Get configuration handle from new or existing "default" configuration. '''
 
+        # Use cached handle, if available.
+
+        if self.config_handle_cache is not None:
+            return self.config_handle_cache
+
         # Determine if a default configuration exists.
 
         config_id_bytearray = bytearray()
@@ -687,22 +826,30 @@ class G2Client:
         else:
             config_handle = self.g2_config.create()
 
+        self.config_handle_cache = config_handle
         return config_handle
 
     def get_datasources(self):
         ''' Determine datasources already defined. '''
 
+        if self.datasources_cache is not None:
+            return self.datasources_cache
+
         config_handle = self.get_config_handle()
         datasources_bytearray = bytearray()
         self.g2_config.listDataSources(config_handle, datasources_bytearray)
         datasources_dictionary = json.loads(datasources_bytearray.decode())
-        return [x.get("DSRC_CODE") for x in datasources_dictionary.get("DATA_SOURCES")]
+        self.datasources_cache = [x.get("DSRC_CODE") for x in datasources_dictionary.get("DATA_SOURCES")]
+        return self.datasources_cache
 
     def get_default_config_id(self):
         ''' Get the current configuration id.  SYS_CFG.CONFIG_DATA_ID'''
+        if self.default_config_id_cache is not None:
+            return self.default_config_id_cache
         configuration_id_bytearray = bytearray()
         self.g2_configuration_manager.getDefaultConfigID(configuration_id_bytearray)
-        return configuration_id_bytearray.decode()
+        self.default_config_id_cache = configuration_id_bytearray.decode()
+        return self.default_config_id_cache
 
     def get_g2_configuration_dictionary(self):
         ''' Construct a dictionary in the form of the old ini files. '''
@@ -733,6 +880,13 @@ class G2Client:
     def persist_configuration(self, config_handle, configuration_comment=""):
         ''' Save configuration to the Senzing G2 database. '''
 
+        # The in-memory configuration behind config_handle has been modified,
+        # so force a reload on the next get_config_handle() or
+        # get_datasources() call.
+
+        self.config_handle_cache = None
+        self.datasources_cache = None
+
         # Get JSON string with new datasource added.
 
         configuration_bytearray = bytearray()
@@ -753,7 +907,11 @@ class G2Client:
 
         # Set Default configuration.
 
+        # The new ID is already in hand, so refresh the cache directly
+        # instead of forcing get_default_config_id() back to the SDK.
+
         self.g2_configuration_manager.setDefaultConfigID(configuration_id_bytearray)
+        self.default_config_id_cache = configuration_id_bytearray.decode()
 
         # Re-initialize G2 engine.
 
@@ -783,7 +941,7 @@ class G2Client:
         response_bytearray = bytearray()
 
         try:
-            if self.config.get('senzing_sdk_version_major') == 2:
+            if self.senzing_sdk_version_major == 2:
                 self.g2_engine.searchByAttributesV2(data_as_json, flags, response_bytearray)
             else:
                 self.g2_engine.searchByAttributes(data_as_json, response_bytearray, flags)
@@ -793,8 +951,8 @@ class G2Client:
 
         # Log a successful result.
 
-        if result:
-            logging.info(message_info(105, configuration_id.decode()))
+        if result and LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(message_info(105, configuration_id.decode()))
 
         # Epilog.
 
@@ -823,7 +981,7 @@ class G2Initializer:
         try:
             self.g2_configuration_manager.getDefaultConfigID(default_config_id_bytearray)
         except Exception as err:
-            raise Exception("G2ConfigMgr.getDefaultConfigID({0}) failed".format(default_config_id_bytearray)) from err
+            raise Exception(f"G2ConfigMgr.getDefaultConfigID({default_config_id_bytearray}) failed") from err
 
         # If a default configuration exists, there is nothing more to do.
 
@@ -837,9 +995,9 @@ class G2Initializer:
         try:
             return_code = self.g2_config.save(config_handle, configuration_bytearray)
         except Exception as err:
-            raise Exception("G2Confg.save({0}, {1}) failed".format(config_handle, configuration_bytearray)) from err
+            raise Exception(f"G2Confg.save({config_handle}, {configuration_bytearray}) failed") from err
         if return_code != 0:
-            raise Exception("G2Confg.save({0}, {1}) return code {2}".format(config_handle, configuration_bytearray, return_code))
+            raise Exception(f"G2Confg.save({config_handle}, {configuration_bytearray}) return code {return_code}")
 
         self.g2_config.close(config_handle)
 
@@ -850,18 +1008,18 @@ class G2Initializer:
         try:
             return_code = self.g2_configuration_manager.addConfig(configuration_bytearray.decode(), config_comment, new_config_id)
         except Exception as err:
-            raise Exception("G2ConfigMgr.addConfig({0}, {1}, {2}) failed".format(configuration_bytearray.decode(), config_comment, new_config_id)) from err
+            raise Exception(f"G2ConfigMgr.addConfig({configuration_bytearray.decode()}, {config_comment}, {new_config_id}) failed") from err
         if return_code != 0:
-            raise Exception("G2ConfigMgr.addConfig({0}, {1}, {2}) return code {3}".format(configuration_bytearray.decode(), config_comment, new_config_id, return_code))
+            raise Exception(f"G2ConfigMgr.addConfig({configuration_bytearray.decode()}, {config_comment}, {new_config_id}) return code {return_code}")
 
         # Set the default configuration ID.
 
         try:
             return_code = self.g2_configuration_manager.setDefaultConfigID(new_config_id)
         except Exception as err:
-            raise Exception("G2ConfigMgr.setDefaultConfigID({0}) failed".format(new_config_id)) from err
+            raise Exception(f"G2ConfigMgr.setDefaultConfigID({new_config_id}) failed") from err
         if return_code != 0:
-            raise Exception("G2ConfigMgr.setDefaultConfigID({0}) return code {1}".format(new_config_id, return_code))
+            raise Exception(f"G2ConfigMgr.setDefaultConfigID({new_config_id}) return code {return_code}")
 
 # -----------------------------------------------------------------------------
 # Utility functions
@@ -874,28 +1032,46 @@ def create_signal_handler_function(args):
     '''
 
     def result_function(signal_number, frame):
-        logging.info(message_info(298, args))
-        logging.debug(message_debug(901, signal_number, frame))
+        if LOGGER.isEnabledFor(logging.INFO):
+            LOGGER.info(message_info(298, args))
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(message_debug(901, signal_number, frame))
         sys.exit(0)
 
     return result_function
 
 
-def bootstrap_signal_handler(signal_number, frame):
-    ''' Exit on signal error. '''
-    logging.debug(message_debug(901, signal_number, frame))
-    sys.exit(0)
+# Timing keys change between the entry and exit messages; the rest of the
+# configuration is stable after startup, so its redacted form is cached.
+# Both caches key on id(config): this is only safe because the config
+# dicts logged here live for the life of the process, so their ids are
+# never recycled. Do not use these caches for short-lived dicts.
+
+TIMING_KEYS = ('start_time', 'stop_time', 'elapsed_time')
+REDACTED_CONFIGURATION_CACHE = {}
+START_TIMES = {}
+
+
+def redacted_configuration_base(config):
+    ''' Return a cached redaction of config, without the timing keys. '''
+    cache_key = id(config)
+    result = REDACTED_CONFIGURATION_CACHE.get(cache_key)
+    if result is None:
+        result = {key: value for key, value in redact_configuration(config).items() if key not in TIMING_KEYS}
+        REDACTED_CONFIGURATION_CACHE[cache_key] = result
+    return result
 
 
 def entry_template(config):
     ''' Format of entry message. '''
     debug = config.get("debug", False)
-    config['start_time'] = time.time()
+    start_time = time.time()
+    START_TIMES[id(config)] = start_time
     if debug:
-        final_config = config
+        final_config = dict(config, start_time=start_time)
     else:
-        final_config = redact_configuration(config)
-    config_json = json.dumps(final_config, sort_keys=True)
+        final_config = dict(redacted_configuration_base(config), start_time=start_time)
+    config_json = json_dumps_sorted(final_config).decode()
     return message_info(297, config_json)
 
 
@@ -903,13 +1079,16 @@ def exit_template(config):
     ''' Format of exit message. '''
     debug = config.get("debug", False)
     stop_time = time.time()
-    config['stop_time'] = stop_time
-    config['elapsed_time'] = stop_time - config.get('start_time', stop_time)
+    start_time = START_TIMES.pop(id(config), stop_time)
+    elapsed_time = stop_time - start_time
     if debug:
-        final_config = config
+        final_config = dict(config)
     else:
-        final_config = redact_configuration(config)
-    config_json = json.dumps(final_config, sort_keys=True)
+        final_config = dict(redacted_configuration_base(config))
+    final_config['start_time'] = start_time
+    final_config['stop_time'] = stop_time
+    final_config['elapsed_time'] = elapsed_time
+    config_json = json_dumps_sorted(final_config).decode()
     return message_info(298, config_json)
 
 
@@ -948,12 +1127,18 @@ def get_g2_configuration_dictionary(config):
 
 
 def get_g2_configuration_json(config):
-    ''' Return a JSON string with Senzing configuration. '''
-    result = ""
+    ''' Return a JSON string with Senzing configuration.
+        The serialized form is cached on the configuration itself, since
+        the keys it is built from do not change after startup.
+    '''
+    result = config.get('_g2_configuration_json_cached')
+    if result:
+        return result
     if config.get('engine_configuration_json'):
         result = config.get('engine_configuration_json')
     else:
         result = json.dumps(get_g2_configuration_dictionary(config))
+    config['_g2_configuration_json_cached'] = result
     return result
 
 
@@ -964,25 +1149,27 @@ def get_g2_config(config, g2_config_name="configurator-G2-config"):
     if G2_CONFIG_SINGLETON:
         return G2_CONFIG_SINGLETON
 
-    try:
-        g2_configuration_json = get_g2_configuration_json(config)
-        result = G2Config()
+    with G2_CONFIG_LOCK:
 
-        # Backport methods from earlier Senzing versions.
+        # Re-check: another thread may have built the singleton while
+        # this one waited on the lock.
 
-        if config.get('senzing_sdk_version_major') == 2:
-            result.addDataSource = result.addDataSourceV2
-            result.init = result.initV2
-            result.listDataSources = result.listDataSourcesV2
+        if G2_CONFIG_SINGLETON:
+            return G2_CONFIG_SINGLETON
 
-        # Initialize G2ConfigMgr.
+        import_senzing_sdk()
 
-        result.init(g2_config_name, g2_configuration_json, config.get('debug', False))
-    except G2ModuleException as err:
-        exit_error(897, g2_configuration_json, err)
+        try:
+            result = G2Config()
 
-    G2_CONFIG_SINGLETON = result
-    return result
+            # Initialize G2ConfigMgr.
+
+            result.init(g2_config_name, get_g2_configuration_json(config), config.get('debug', False))
+        except G2ModuleException as err:
+            exit_error(897, get_g2_configuration_json(config), err)
+
+        G2_CONFIG_SINGLETON = result
+        return result
 
 
 def get_g2_configuration_manager(config, g2_configuration_manager_name="configurator-G2-configuration-manager"):
@@ -992,23 +1179,27 @@ def get_g2_configuration_manager(config, g2_configuration_manager_name="configur
     if G2_CONFIGURATION_MANAGER_SINGLETON:
         return G2_CONFIGURATION_MANAGER_SINGLETON
 
-    try:
-        g2_configuration_json = get_g2_configuration_json(config)
-        result = G2ConfigMgr()
+    with G2_CONFIGURATION_MANAGER_LOCK:
+
+        # Re-check: another thread may have built the singleton while
+        # this one waited on the lock.
 
-        # Backport methods from earlier Senzing versions.
+        if G2_CONFIGURATION_MANAGER_SINGLETON:
+            return G2_CONFIGURATION_MANAGER_SINGLETON
 
-        if config.get('senzing_sdk_version_major') == 2:
-            result.init = result.initV2
+        import_senzing_sdk()
 
-        # Initialize G2ConfigMgr.
+        try:
+            result = G2ConfigMgr()
 
-        result.init(g2_configuration_manager_name, g2_configuration_json, config.get('debug', False))
-    except G2ModuleException as err:
-        exit_error(896, g2_configuration_json, err)
+            # Initialize G2ConfigMgr.
 
-    G2_CONFIGURATION_MANAGER_SINGLETON = result
-    return result
+            result.init(g2_configuration_manager_name, get_g2_configuration_json(config), config.get('debug', False))
+        except G2ModuleException as err:
+            exit_error(896, get_g2_configuration_json(config), err)
+
+        G2_CONFIGURATION_MANAGER_SINGLETON = result
+        return result
 
 
 def get_g2_engine(config, g2_engine_name="configurator-G2-engine"):
@@ -1018,51 +1209,66 @@ def get_g2_engine(config, g2_engine_name="configurator-G2-engine"):
     if G2_ENGINE_SINGLETON:
         return G2_ENGINE_SINGLETON
 
-    try:
-        g2_configuration_json = get_g2_configuration_json(config)
-        result = G2Engine()
+    with G2_ENGINE_LOCK:
 
-        # Backport methods from earlier Senzing versions.
+        # Re-check: another thread may have built the singleton while
+        # this one waited on the lock.
 
-        if config.get('senzing_sdk_version_major') == 2:
-            result.init = result.initV2
-            result.initWithConfigID = result.initWithConfigIDV2
-            result.reinit = result.reinitV2
+        if G2_ENGINE_SINGLETON:
+            return G2_ENGINE_SINGLETON
 
-        # Initialize G2Engine.
+        import_senzing_sdk()
 
-        result.init(g2_engine_name, g2_configuration_json, config.get('debug', False))
-        config['last_configuration_check'] = time.time()
-    except G2ModuleException as err:
-        exit_error(898, g2_configuration_json, err)
+        try:
+            result = G2Engine()
 
-    G2_ENGINE_SINGLETON = result
-    return result
+            # Initialize G2Engine.
+
+            result.init(g2_engine_name, get_g2_configuration_json(config), config.get('debug', False))
+            config['last_configuration_check'] = time.time()
+        except G2ModuleException as err:
+            exit_error(898, get_g2_configuration_json(config), err)
+
+        G2_ENGINE_SINGLETON = result
+        return result
 
 
 def get_g2_client(config):
     ''' Get the G2Client resource. '''
+    global G2_CLIENT_SINGLETON
 
-    # Create G2 configuration objects.
+    if G2_CLIENT_SINGLETON:
+        return G2_CLIENT_SINGLETON
 
-    g2_config = get_g2_config(config)
-    g2_configuration_manager = get_g2_configuration_manager(config)
+    with G2_CLIENT_LOCK:
 
-    # Initialize G2 database.
+        # Re-check: another thread may have built the singleton while
+        # this one waited on the lock.
 
-    g2_initializer = G2Initializer(g2_configuration_manager, g2_config)
-    try:
-        g2_initializer.initialize()
-    except Exception as err:
-        logging.error(message_error(701, err, type(err.__cause__), err.__cause__))
+        if G2_CLIENT_SINGLETON:
+            return G2_CLIENT_SINGLETON
 
-    # Create G2 engine object.
+        # Create G2 configuration objects.
 
-    g2_engine = get_g2_engine(config)
+        g2_config = get_g2_config(config)
+        g2_configuration_manager = get_g2_configuration_manager(config)
 
-    # Create g2_client object.
+        # Initialize G2 database.
+
+        g2_initializer = G2Initializer(g2_configuration_manager, g2_config)
+        try:
+            g2_initializer.initialize()
+        except Exception as err:
+            logging.error(message_error(701, err, type(err.__cause__), err.__cause__))
+
+        # Create G2 engine object.
 
-    return G2Client(config, g2_engine, g2_configuration_manager, g2_config)
+        g2_engine = get_g2_engine(config)
+
+        # Create g2_client object.
+
+        G2_CLIENT_SINGLETON = G2Client(config, g2_engine, g2_configuration_manager, g2_config)
+        return G2_CLIENT_SINGLETON
 
 # -----------------------------------------------------------------------------
 # Utility functions
@@ -1077,12 +1283,32 @@ def get_config():
 def common_prolog(config):
     ''' Common steps for most do_* functions. '''
     validate_configuration(config)
-    logging.info(entry_template(config))
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info(entry_template(config))
 
 # -----------------------------------------------------------------------------
 # Flask @app.routes
 # -----------------------------------------------------------------------------
 
+# Cache of the serialized GET /datasources response body.
+# Invalidated by http_post_datasources() after datasources are added.
+
+DATASOURCES_RESPONSE_CACHE = {"entry": None}
+
+# Serializes all G2 configuration access from the HTTP handlers: POSTs
+# against each other, and GET cache rebuilds against POSTs. Without the
+# latter, a GET racing a persist could reload the outgoing default
+# configuration and repopulate the G2Client caches with stale state.
+
+DATASOURCES_WRITE_LOCK = threading.Lock()
+
+# Response factories with the status and Content-Type bound once.
+# direct_passthrough ships the pre-serialized bytes straight to the WSGI
+# writer without wrapping them in an iterator.
+
+JSON_RESPONSE_200 = functools.partial(Response, status=status.HTTP_200_OK, mimetype='application/json', direct_passthrough=True)
+JSON_RESPONSE_201 = functools.partial(Response, status=status.HTTP_201_CREATED, mimetype='application/json', direct_passthrough=True)
+
 
 @APP.route("/datasources", methods=['GET'])
 def http_get_datasources():
@@ -1090,21 +1316,51 @@ def http_get_datasources():
     List existing DataSources.
     '''
 
-    # Create g2_client object.
+    # Use the cached response body and ETag, if available.
 
-    config = get_config()
-    g2_client = get_g2_client(config)
+    cache_entry = DATASOURCES_RESPONSE_CACHE.get("entry")
+
+    if cache_entry is None:
+        with DATASOURCES_WRITE_LOCK:
+            cache_entry = DATASOURCES_RESPONSE_CACHE.get("entry")
+            if cache_entry is None:
+
+                # Create g2_client object.
 
-    # Get results from Senzing G2.
+                config = get_config()
+                g2_client = get_g2_client(config)
 
-    response = g2_client.get_datasources()
+                # Get results from Senzing G2.
+
+                response = g2_client.get_datasources()
+
+                # Serialize once and cache for subsequent GETs.
+                # Key sorting is intentionally skipped; it only matters
+                # for log-diff stability, not for HTTP responses.
+                # The ETag is derived from the body so it stays valid
+                # across process restarts.
+
+                response_body = json_dumps_bytes(response)
+                etag = 'W/"{0}"'.format(hashlib.sha256(response_body).hexdigest())
+                cache_entry = (response_body, etag)
+                DATASOURCES_RESPONSE_CACHE["entry"] = cache_entry
+
+    response_body, etag = cache_entry
+
+    # The datasource list only changes on POST, so the ETag lets
+    # steady-state pollers skip the body entirely.
+
+    if flask_request.headers.get('If-None-Match') == etag:
+        http_response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        http_response.headers['ETag'] = etag
+        return http_response
 
     # Craft the HTTP response.
 
-    response_pretty = json.dumps(response, sort_keys=True)
-    response_status = status.HTTP_200_OK
-    mimetype = 'application/json'
-    return Response(response=response_pretty, status=response_status, mimetype=mimetype)
+    http_response = JSON_RESPONSE_200(response=response_body)
+    http_response.headers['Content-Length'] = str(len(response_body))
+    http_response.headers['ETag'] = etag
+    return http_response
 
 
 @APP.route("/datasources", methods=['POST'])
@@ -1114,9 +1370,10 @@ def http_post_datasources():
     '''
 
     # Get the HTTP POST body as dictionary.
+    # The raw bytes go straight to the parser; orjson accepts bytes, so
+    # no intermediate text decode is needed.
 
-    payload = flask_request.get_data(as_text=True)
-    payload_dictionary = json.loads(payload)
+    payload_dictionary = json_loads(flask_request.get_data())
 
     # Create g2_client object.
 
@@ -1124,14 +1381,33 @@ def http_post_datasources():
     g2_client = get_g2_client(config)
 
     # Determine what new datasources need to be created.
+    # A single pass deduplicates the payload (order preserved) and
+    # partitions it with O(1) set membership tests.
+
+    with DATASOURCES_WRITE_LOCK:
+
+        existing_datasource_set = set(g2_client.get_datasources())
+        new_datasources = []
+        not_needed_datasources = []
+        seen_datasources = set()
+        for item in payload_dictionary:
+            if item in seen_datasources:
+                continue
+            seen_datasources.add(item)
+            if item in existing_datasource_set:
+                not_needed_datasources.append(item)
+            else:
+                new_datasources.append(item)
 
-    existing_datasources = g2_client.get_datasources()
-    new_datasources = [item for item in payload_dictionary if item not in existing_datasources]
-    not_needed_datasources = [item for item in payload_dictionary if item in existing_datasources]
+        # Create the new datasources.
 
-    # Create the new datasources.
+        if new_datasources:
+            g2_client.add_datasources(new_datasources)
 
-    g2_client.add_datasources(new_datasources)
+            # Invalidate the cached GET /datasources response body; the
+            # next GET rebuilds it along with a fresh content-derived ETag.
+
+            DATASOURCES_RESPONSE_CACHE["entry"] = None
 
     # Craft the HTTP response.
 
@@ -1140,39 +1416,43 @@ def http_post_datasources():
         "createdDatasources": new_datasources
     }
 
-    response_pretty = json.dumps(response, sort_keys=True)
-    response_status = status.HTTP_201_CREATED
-    mimetype = 'application/json'
-    return Response(response=response_pretty, status=response_status, mimetype=mimetype)
+    response_body = json_dumps_bytes(response)
+    http_response = JSON_RESPONSE_201(response=response_body)
+    http_response.headers['Content-Length'] = str(len(response_body))
+    return http_response
 
 # -----------------------------------------------------------------------------
 # do_* functions
-#   Common function signature: do_XXX(args)
+#   Common function signature: do_XXX(subcommand, args, config=None)
 # -----------------------------------------------------------------------------
 
 
-def do_docker_acceptance_test(subcommand, args):
+def do_docker_acceptance_test(subcommand, args, config=None):
     ''' For use with Docker acceptance testing. '''
 
     # Get context from CLI, environment variables, and ini files.
 
-    config = get_configuration(subcommand, args)
+    if config is None:
+        config = get_configuration(subcommand, args)
 
     # Prolog.
 
-    logging.info(entry_template(config))
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info(entry_template(config))
 
     # Epilog.
 
-    logging.info(exit_template(config))
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info(exit_template(config))
 
 
-def do_service(subcommand, args):
+def do_service(subcommand, args, config=None):
     ''' Run a Flask application to handle HTTP calls. '''
 
     # Get context from CLI, environment variables, and ini files.
 
-    config = get_configuration(subcommand, args)
+    if config is None:
+        config = get_configuration(subcommand, args)
     common_prolog(config)
 
     host = config.get('host')
@@ -1181,23 +1461,26 @@ def do_service(subcommand, args):
 
     # Run the service application.
 
-    APP.run(host=host, port=port, debug=debug, threaded=False)
+    APP.run(host=host, port=port, debug=debug, threaded=True)
 
     # Epilog.
 
-    logging.info(exit_template(config))
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info(exit_template(config))
 
 
-def do_sleep(subcommand, args):
+def do_sleep(subcommand, args, config=None):
     ''' Sleep.  Used for debugging. '''
 
     # Get context from CLI, environment variables, and ini files.
 
-    config = get_configuration(subcommand, args)
+    if config is None:
+        config = get_configuration(subcommand, args)
 
     # Prolog.
 
-    logging.info(entry_template(config))
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info(entry_template(config))
 
     # Pull values from configuration.
 
@@ -1210,22 +1493,32 @@ def do_sleep(subcommand, args):
         time.sleep(sleep_time_in_seconds)
 
     else:
-        sleep_time_in_seconds = 3600
         while True:
             logging.info(message_info(295))
-            time.sleep(sleep_time_in_seconds)
+            signal.pause()
 
     # Epilog.
 
-    logging.info(exit_template(config))
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info(exit_template(config))
 
 
-def do_version(subcommand, args):
+def do_version(subcommand, args, config=None):
     ''' Log version information. '''
 
     logging.info(message_info(294, __version__, __updated__))
     logging.debug(message_debug(902, subcommand, args))
 
+
+# Map subcommand names to their do_* functions.
+
+SUBCOMMAND_DISPATCH = {
+    "docker-acceptance-test": do_docker_acceptance_test,
+    "service": do_service,
+    "sleep": do_sleep,
+    "version": do_version,
+}
+
 # -----------------------------------------------------------------------------
 # Main
 # -----------------------------------------------------------------------------
@@ -1233,31 +1526,27 @@ def do_version(subcommand, args):
 
 if __name__ == "__main__":
 
-    # Configure logging. See https://docs.python.org/2/library/logging.html#levels
+    # Read environment variables once.
 
-    LOG_LEVEL_MAP = {
-        "notset": logging.NOTSET,
-        "debug": logging.DEBUG,
-        "info": logging.INFO,
-        "fatal": logging.FATAL,
-        "warning": logging.WARNING,
-        "error": logging.ERROR,
-        "critical": logging.CRITICAL
-    }
+    ENVIRON = os.environ
+    LOG_LEVEL_PARAMETER = ENVIRON.get("SENZING_LOG_LEVEL", "info").lower()
+    SUBCOMMAND = ENVIRON.get("SENZING_SUBCOMMAND")
+    DOCKER_LAUNCHED = ENVIRON.get("SENZING_DOCKER_LAUNCHED", "")
+
+    # Configure logging.
 
-    LOG_LEVEL_PARAMETER = os.getenv("SENZING_LOG_LEVEL", "info").lower()
     LOG_LEVEL = LOG_LEVEL_MAP.get(LOG_LEVEL_PARAMETER, logging.INFO)
     logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
     logging.debug(message_debug(998))
 
-    # Trap signals temporarily until args are parsed.
+    # Until args are parsed, let the C-level default handlers cover the
+    # bootstrap window; no Python trampoline is needed yet.
 
-    signal.signal(signal.SIGTERM, bootstrap_signal_handler)
-    signal.signal(signal.SIGINT, bootstrap_signal_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGINT, signal.default_int_handler)
 
     # Parse the command line arguments.
 
-    SUBCOMMAND = os.getenv("SENZING_SUBCOMMAND", None)
     PARSER = get_parser()
     if len(sys.argv) > 1:
         ARGS = PARSER.parse_args()
@@ -1266,9 +1555,16 @@ if __name__ == "__main__":
         ARGS = argparse.Namespace(subcommand=SUBCOMMAND)
     else:
         PARSER.print_help()
-        if len(os.getenv("SENZING_DOCKER_LAUNCHED", "")) > 0:
+        if len(DOCKER_LAUNCHED) > 0:
             SUBCOMMAND = "sleep"
             ARGS = argparse.Namespace(subcommand=SUBCOMMAND)
+
+            # Catch interrupts before parking in do_sleep() so a
+            # docker stop or Ctrl-C still exits cleanly.
+
+            SIGNAL_HANDLER = create_signal_handler_function(ARGS)
+            signal.signal(signal.SIGINT, SIGNAL_HANDLER)
+            signal.signal(signal.SIGTERM, SIGNAL_HANDLER)
             do_sleep(SUBCOMMAND, ARGS)
         exit_silently()
 
@@ -1282,17 +1578,13 @@ if __name__ == "__main__":
 
     GLOBAL_CONFIG = get_configuration(SUBCOMMAND, ARGS)
 
-    # Transform subcommand from CLI parameter to function name string.
+    # Look up the subcommand's handler function.
 
-    SUBCOMMAND_FUNCTION_NAME = "do_{0}".format(SUBCOMMAND.replace('-', '_'))
+    SUBCOMMAND_FUNCTION = SUBCOMMAND_DISPATCH.get(SUBCOMMAND)
 
-    # Test to see if function exists in the code.
-
-    if SUBCOMMAND_FUNCTION_NAME not in globals():
+    if SUBCOMMAND_FUNCTION is None:
         logging.warning(message_warning(696, SUBCOMMAND))
         PARSER.print_help()
         exit_silently()
 
-    # Tricky code for calling function based on string.
-
-    globals()[SUBCOMMAND_FUNCTION_NAME](SUBCOMMAND, ARGS)
+    SUBCOMMAND_FUNCTION(SUBCOMMAND, ARGS, config=GLOBAL_CONFIG)
@@ -0,0 +1,44 @@
+#! /usr/bin/env python3
+
+'''
+wsgi.py - WSGI entry point for running the configurator service under a
+production WSGI server, e.g.:
+
+  gunicorn --workers 1 --threads 4 --bind 0.0.0.0:8253 wsgi:app
+
+Run a single worker process: the datasource caches and their
+invalidation are per-process, so a POST handled by one worker would
+leave other workers serving stale datasource lists. Do not use
+--preload: the Senzing engine is initialized at import time, and native
+engine/database handles must not be opened in the gunicorn master and
+forked into workers.
+
+Configuration comes from environment variables only; the G2Client is
+primed at import time so the first HTTP request does not pay Senzing
+initialization cost.
+'''
+
+import argparse
+import logging
+import os
+
+import configurator
+
+# Configure logging.
+
+LOG_LEVEL_PARAMETER = os.environ.get("SENZING_LOG_LEVEL", "info").lower()
+LOG_LEVEL = configurator.LOG_LEVEL_MAP.get(LOG_LEVEL_PARAMETER, logging.INFO)
+logging.basicConfig(format=configurator.LOG_FORMAT, level=LOG_LEVEL)
+
+# Build configuration from environment variables and defaults.
+
+SUBCOMMAND = "service"
+ARGS = argparse.Namespace(subcommand=SUBCOMMAND)
+configurator.GLOBAL_CONFIG = configurator.get_configuration(SUBCOMMAND, ARGS)
+configurator.validate_configuration(configurator.GLOBAL_CONFIG)
+
+# Prime the G2Client so workers initialize Senzing before serving traffic.
+
+configurator.get_g2_client(configurator.GLOBAL_CONFIG)
+
+app = configurator.APP